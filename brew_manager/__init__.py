@@ -0,0 +1,12 @@
+"""brew-manager: template-driven Homebrew setup tooling.
+
+Grown out of brew.sh / brew_up.py — the package lists live in a YAML config
+with named machine templates instead of arrays hard-coded in a shell script.
+"""
+
+from brew_manager.config import Config, PackageConfig, TemplateConfig
+from brew_manager.scanner import BrewScanner
+
+__version__ = "1.0"
+
+__all__ = ["BrewScanner", "Config", "PackageConfig", "TemplateConfig"]
@@ -0,0 +1,384 @@
+"""Configuration models for brew-manager.
+
+The YAML config holds the shared package lists plus named machine templates
+(e.g. "work laptop", "home desktop") that mix and match them.
+"""
+
+import json
+from itertools import chain
+from pathlib import Path
+from typing import Dict, List
+
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
+
+# pydantic needs the typing_extensions TypedDict on Python < 3.12.
+from typing_extensions import TypedDict
+
+DEFAULT_CONFIG_DIR = Path.home() / ".config" / "brew-manager"
+
+# PyYAML import deferred to first file I/O so code paths that never touch a
+# config file do not pay for it; resolved once into (module, Loader, Dumper).
+_YAML = None
+
+
+def _get_yaml():
+    """Import PyYAML on first use and pick the libyaml classes if present."""
+    global _YAML
+    if _YAML is None:
+        import yaml
+
+        _YAML = (
+            yaml,
+            getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+            getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        )
+    return _YAML
+
+
+_orjson = False
+
+
+def _get_orjson():
+    """Import orjson on first use; None when unavailable."""
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson as _orjson
+        except ImportError:
+            _orjson = None
+    return _orjson
+
+# Parsed configs keyed by resolved path; entries are (mtime_ns, Config).
+# Repeat loads of an unchanged file skip the whole parse+validate cycle.
+_CONFIG_CACHE: Dict[Path, tuple] = {}
+
+
+# Default package lists as immutable module-level tuples; each PackageConfig
+# copies them into its own lists, so instances never share (or mutate) the
+# defaults and the literals are built once at import.
+_ESSENTIAL_FORMULAE = ("git", "gh", "jq", "wget", "curl", "tree", "htop")
+_DEVELOPMENT_FORMULAE = ("node", "python", "go")
+_ESSENTIAL_CASKS = ("1password", "1password-cli", "iterm2", "obsidian")
+_DEVELOPMENT_CASKS = ("cursor", "chromium")
+_PRODUCTIVITY_CASKS = ("zen-browser", "mozilla-vpn", "yubico-authenticator")
+
+
+class PackageConfig(BaseModel):
+    """Package lists shared by every template."""
+
+    essential_formulae: List[str] = Field(
+        default_factory=lambda: list(_ESSENTIAL_FORMULAE)
+    )
+    development_formulae: List[str] = Field(
+        default_factory=lambda: list(_DEVELOPMENT_FORMULAE)
+    )
+    essential_casks: List[str] = Field(default_factory=lambda: list(_ESSENTIAL_CASKS))
+    development_casks: List[str] = Field(
+        default_factory=lambda: list(_DEVELOPMENT_CASKS)
+    )
+    productivity_casks: List[str] = Field(
+        default_factory=lambda: list(_PRODUCTIVITY_CASKS)
+    )
+
+
+class TemplateConfig(BaseModel):
+    """One named machine template."""
+
+    description: str = ""
+    include_development: bool = False
+    include_productivity: bool = False
+    custom_formulae: List[str] = Field(default=[])
+    custom_casks: List[str] = Field(default=[])
+
+
+class _ConfigScalars(TypedDict, total=False):
+    """The top-level Config fields outside packages/templates."""
+
+    app_name: str
+    version: str
+    config_dir: Path
+    templates_dir: Path
+    output_dir: Path
+
+
+# Built once at import so repeated loads reuse the compiled validators for
+# the nested sections (and the residual top-level fields) instead of
+# re-resolving their schemas.
+_PACKAGES_ADAPTER = TypeAdapter(PackageConfig)
+_TEMPLATES_ADAPTER = TypeAdapter(Dict[str, TemplateConfig])
+_SCALARS_ADAPTER = TypeAdapter(_ConfigScalars)
+
+
+class Config(BaseModel):
+    """Top-level brew-manager configuration."""
+
+    app_name: str = "brew-manager"
+    version: str = "1.0"
+    config_dir: Path = Field(default_factory=lambda: DEFAULT_CONFIG_DIR)
+    templates_dir: Path = Field(
+        default_factory=lambda: DEFAULT_CONFIG_DIR / "templates"
+    )
+    output_dir: Path = Field(default_factory=lambda: DEFAULT_CONFIG_DIR / "output")
+    packages: PackageConfig = Field(default_factory=PackageConfig)
+    templates: Dict[str, TemplateConfig] = Field(default_factory=dict)
+
+    # Resolved (formulae, casks) tuples per template name; get_all_packages
+    # is pure with respect to packages + one template, so results are reused.
+    # Mutating self.packages in place cannot be observed here — callers that
+    # do so must follow up with invalidate_packages_cache().
+    _packages_cache: Dict[str, tuple] = PrivateAttr(default_factory=dict)
+    # Directories this instance has already created/verified.
+    _dirs_ready: set = PrivateAttr(default_factory=set)
+
+    @classmethod
+    def load_from_file(cls, config_path: Path, trusted: bool = False) -> "Config":
+        """Load a configuration from a YAML file.
+
+        trusted=True is for files this tool wrote itself: the models are
+        assembled with model_construct, skipping the full validation walk
+        that an untrusted or hand-edited file still gets.
+        """
+        key = Path(config_path).resolve()
+        mtime_ns = key.stat().st_mtime_ns
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        # A JSON sidecar written after the last successful parse is much
+        # cheaper to read than YAML; the YAML file stays the source of truth.
+        cache_path = cls._sidecar_path(key)
+        data = cls._read_sidecar(cache_path, mtime_ns)
+        if data is not None:
+            config = cls._construct_trusted(data)
+        else:
+            yaml, yaml_loader, _ = _get_yaml()
+            with open(config_path) as f:
+                data = yaml.load(f, Loader=yaml_loader) or {}
+            config = (
+                cls._construct_trusted(data) if trusted else cls.parse_obj_fast(data)
+            )
+            cls._write_sidecar(cache_path, mtime_ns, config)
+        _CONFIG_CACHE[key] = (mtime_ns, config)
+        return config
+
+    @staticmethod
+    def peek_version(config_path: Path):
+        """Read just the version field from the head of a config file.
+
+        Compatibility probe that parses only the first 512 bytes — the
+        app_name/version keys are always emitted first — instead of the
+        whole document. Returns None when the header cannot be parsed
+        (callers then fall back to a full load_from_file).
+        """
+        yaml, yaml_loader, _ = _get_yaml()
+        try:
+            with open(config_path) as f:
+                head = f.read(512)
+            data = yaml.load(head, Loader=yaml_loader)
+        except (OSError, yaml.YAMLError):
+            return None
+        if isinstance(data, dict):
+            return data.get("version")
+        return None
+
+    @staticmethod
+    def _sidecar_path(key: Path) -> Path:
+        return key.with_name(key.name + ".cache.json")
+
+    @staticmethod
+    def _read_sidecar(cache_path: Path, mtime_ns: int):
+        """Return the cached config data if the sidecar matches the source."""
+        try:
+            raw = cache_path.read_bytes()
+        except OSError:
+            return None
+        orjson = _get_orjson()
+        try:
+            payload = orjson.loads(raw) if orjson else json.loads(raw)
+        except ValueError:
+            return None
+        if payload.get("source_mtime_ns") != mtime_ns:
+            return None
+        return payload.get("data")
+
+    def _write_sidecar_payload(self) -> dict:
+        return self.model_dump(mode="json")
+
+    @classmethod
+    def _write_sidecar(cls, cache_path: Path, mtime_ns: int, config: "Config") -> None:
+        payload = {
+            "source_mtime_ns": mtime_ns,
+            "data": config._write_sidecar_payload(),
+        }
+        orjson = _get_orjson()
+        try:
+            cache_path.write_bytes(
+                orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+            )
+        except OSError:
+            pass  # best-effort cache; the YAML is still there
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop all cached parses (hot reload, tests).
+
+        This clears the module-level file cache only; for the per-instance
+        resolved package lists see invalidate_packages_cache.
+        """
+        _CONFIG_CACHE.clear()
+
+    def invalidate_packages_cache(self) -> None:
+        """Recompute the resolved package lists after mutating self.packages.
+
+        Plain list mutation on the shared PackageConfig cannot be observed
+        by the cache, so callers that change those lists in place must call
+        this afterwards.
+        """
+        self._packages_cache.clear()
+        for name, template in self.templates.items():
+            self._packages_cache[name] = self._resolve_packages(template)
+
+    @classmethod
+    def parse_obj_fast(cls, data: dict) -> "Config":
+        """Validate every section via the cached TypeAdapters.
+
+        Same guarantees as model_validate — bad input raises a
+        ValidationError, str paths are coerced to Path — just without
+        re-resolving the schemas on each load.
+        """
+        if not isinstance(data, dict):
+            # Not a mapping at all; let the full validator phrase the error.
+            return cls.model_validate(data)
+        data = dict(data)
+        packages = data.pop("packages", None)
+        templates = data.pop("templates", None) or {}
+        return cls.model_construct(
+            packages=(
+                _PACKAGES_ADAPTER.validate_python(packages)
+                if packages is not None
+                else PackageConfig()
+            ),
+            templates=_TEMPLATES_ADAPTER.validate_python(templates),
+            **_SCALARS_ADAPTER.validate_python(data),
+        )
+
+    @classmethod
+    def _construct_trusted(cls, data: dict) -> "Config":
+        """Build a Config from already-validated data without re-validating."""
+        data = dict(data)
+        for key in ("config_dir", "templates_dir", "output_dir"):
+            if key in data:
+                data[key] = Path(data[key])
+        packages = data.pop("packages", None)
+        templates = data.pop("templates", None) or {}
+        return cls.model_construct(
+            packages=(
+                PackageConfig.model_construct(**packages)
+                if isinstance(packages, dict)
+                else PackageConfig()
+            ),
+            templates={
+                name: TemplateConfig.model_construct(**value)
+                for name, value in templates.items()
+            },
+            **data,
+        )
+
+    def _serializable(self) -> dict:
+        """Assemble the YAML document by hand, fields in declaration order.
+
+        The schema is small and fixed, so direct attribute access beats the
+        generic model_dump reflection walk and guarantees a stable key order
+        in the emitted file (which peek_version relies on for the header).
+        """
+        packages = self.packages
+        return {
+            "app_name": self.app_name,
+            "version": self.version,
+            "config_dir": str(self.config_dir),
+            "templates_dir": str(self.templates_dir),
+            "output_dir": str(self.output_dir),
+            "packages": {
+                "essential_formulae": list(packages.essential_formulae),
+                "development_formulae": list(packages.development_formulae),
+                "essential_casks": list(packages.essential_casks),
+                "development_casks": list(packages.development_casks),
+                "productivity_casks": list(packages.productivity_casks),
+            },
+            "templates": {
+                name: {
+                    "description": template.description,
+                    "include_development": template.include_development,
+                    "include_productivity": template.include_productivity,
+                    "custom_formulae": list(template.custom_formulae),
+                    "custom_casks": list(template.custom_casks),
+                }
+                for name, template in self.templates.items()
+            },
+        }
+
+    def save_to_file(self, config_path: Path) -> None:
+        """Write the configuration back out as YAML."""
+        self.ensure_directories()
+        data = self._serializable()
+        yaml, _, yaml_dumper = _get_yaml()
+        with open(config_path, "w") as f:
+            yaml.dump(
+                data, f, Dumper=yaml_dumper, default_flow_style=False, sort_keys=False
+            )
+        # The sidecar now describes stale content; drop it and let the next
+        # load rebuild it.
+        self._sidecar_path(Path(config_path).resolve()).unlink(missing_ok=True)
+
+    def ensure_directories(self) -> None:
+        """Create the config/templates/output directories if missing.
+
+        Verified directories are remembered per instance, so repeated saves
+        in one process do not re-issue mkdir syscalls.
+        """
+        for directory in (self.config_dir, self.templates_dir, self.output_dir):
+            if directory in self._dirs_ready:
+                continue
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
+            self._dirs_ready.add(directory)
+
+    def model_post_init(self, __context) -> None:
+        # Template generation touches every template anyway, so the resolved
+        # lists are materialized once up front rather than lazily per lookup.
+        for name, template in self.templates.items():
+            self._packages_cache[name] = self._resolve_packages(template)
+
+    def _resolve_packages(self, template: TemplateConfig) -> tuple:
+        """Resolve one template into (formulae, casks) tuples."""
+        dev = template.include_development
+        formulae = chain(
+            self.packages.essential_formulae,
+            self.packages.development_formulae if dev else (),
+            template.custom_formulae,
+        )
+        casks = chain(
+            self.packages.essential_casks,
+            self.packages.development_casks if dev else (),
+            self.packages.productivity_casks if template.include_productivity else (),
+            template.custom_casks,
+        )
+        # dict.fromkeys dedupes in one pass and keeps insertion order, so
+        # the resolved lists come out deterministic; tuples make the
+        # cached value safe to share.
+        return (tuple(dict.fromkeys(formulae)), tuple(dict.fromkeys(casks)))
+
+    def get_all_packages(self, template_name: str) -> Dict[str, List[str]]:
+        """Resolve the full formula/cask lists for one template."""
+        cached = self._packages_cache.get(template_name)
+        if cached is None:
+            # Only reachable when templates was mutated behind add_template's
+            # back; resolve and backfill.
+            cached = self._resolve_packages(self.templates[template_name])
+            self._packages_cache[template_name] = cached
+        # Fresh lists per call so callers cannot poison the cache.
+        return {"formulae": list(cached[0]), "casks": list(cached[1])}
+
+    def add_template(self, name: str, template: TemplateConfig) -> None:
+        """Register (or replace) a named template."""
+        self.templates[name] = template
+        self._packages_cache[name] = self._resolve_packages(template)
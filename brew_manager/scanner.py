@@ -0,0 +1,120 @@
+"""System scanner for brew-manager.
+
+Walks the installed applications and correlates them against the package
+lists from the active Config.
+"""
+
+import os
+from dataclasses import asdict, dataclass, field
+from itertools import chain
+from pathlib import Path
+from typing import List, Optional
+
+from brew_manager.config import Config
+
+# A rich Console probes the terminal and pulls in pygments on first styled
+# output, so one shared instance serves every scanner. The import is also
+# deferred here to keep brew_manager imports light.
+_CONSOLE = None
+
+
+def _get_console():
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+@dataclass(slots=True)
+class ScanResults:
+    """Scan output as parallel arrays — index i describes one application.
+
+    Cheaper to build, iterate and serialize than a list with one dict per
+    app once the count reaches hundreds.
+    """
+
+    names: List[str] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+    brew_equivalents: List[Optional[str]] = field(default_factory=list)
+
+
+class BrewScanner:
+    """Scans installed applications and matches them against brew casks."""
+
+    APPLICATIONS_DIR = Path("/Applications")
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.console = _get_console()
+        self._known_casks = None
+
+    def known_casks(self) -> frozenset:
+        """All configured cask names, lowercased, as a frozenset.
+
+        Built once per scanner so the per-app check in scan_system is a
+        single hash lookup rather than three list scans.
+        """
+        if self._known_casks is None:
+            packages = self.config.packages
+            self._known_casks = frozenset(
+                cask.lower()
+                for cask in chain(
+                    packages.essential_casks,
+                    packages.development_casks,
+                    packages.productivity_casks,
+                )
+            )
+        return self._known_casks
+
+    def scan_system(self) -> ScanResults:
+        """Collect installed .app bundles and any known brew equivalents."""
+        results = ScanResults()
+        try:
+            it = os.scandir(self.APPLICATIONS_DIR)
+        except (FileNotFoundError, NotADirectoryError):
+            return results
+        known_casks = self.known_casks()
+        # DirEntry caches the d_type from the directory read, so the .app and
+        # is_dir tests cost no extra stat per entry.
+        with it:
+            entries = [
+                entry
+                for entry in it
+                if entry.name.endswith(".app") and entry.is_dir(follow_symlinks=False)
+            ]
+        entries.sort(key=lambda entry: entry.name)
+        for entry in entries:
+            app_name = entry.name[:-4]
+            cask = app_name.lower().replace(" ", "-")
+            results.names.append(app_name)
+            results.paths.append(entry.path)
+            results.brew_equivalents.append(cask if cask in known_casks else None)
+        return results
+
+    def display_results(self, results: ScanResults) -> None:
+        """Print a summary table of the scan."""
+        from rich.table import Table
+
+        table = Table(title="🍺 brew-manager scan")
+        table.add_column("Application")
+        table.add_column("Brew cask")
+        for name, cask in zip(results.names, results.brew_equivalents):
+            table.add_row(name, cask or "—")
+        self.console.print(table)
+
+    def export_results(self, results: ScanResults, output_path: Path) -> None:
+        """Write scan results as JSON (orjson when available)."""
+        from brew_manager.config import _get_orjson
+
+        orjson = _get_orjson()
+        if orjson is not None:
+            Path(output_path).write_bytes(
+                orjson.dumps(results, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            import json
+
+            with open(output_path, "w") as f:
+                json.dump(asdict(results), f, indent=2)
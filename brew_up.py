@@ -0,0 +1,799 @@
+#!/usr/bin/env python3
+
+# =============================================================================
+# Brew-Up Application Checker
+# =============================================================================
+# Companion to brew.sh. Scans the applications installed on this machine,
+# works out which ones are already managed by Homebrew, and suggests brew
+# casks/formulae for the ones that are not.
+#
+# Usage: ./brew_up.py
+# =============================================================================
+
+import functools
+import json
+import os
+import platform
+import re
+import select
+import subprocess
+import sys
+import termios
+import time
+import tty
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+# =============================================================================
+# VIRTUAL ENVIRONMENT BOOTSTRAP
+# =============================================================================
+# Third-party modules live in a local venv next to the script, so the script
+# works on a fresh machine without polluting the system Python.
+MODULE_VENV = Path(__file__).parent / ".venv"
+REQUIRED_MODULES = ["colorama", "pyahocorasick", "orjson", "rapidfuzz"]
+
+
+def module_venv():
+    """Create the local venv, install required modules, and re-exec inside it.
+
+    Normal runs should not pay for this: if colorama already imports (system
+    install or an earlier bootstrap), nothing happens, and once the venv is
+    provisioned a sentinel file skips the pip probe on every later run.
+    Pass --setup to force a reinstall of the required modules.
+    """
+    if sys.prefix == str(MODULE_VENV):
+        return
+    force_setup = "--setup" in sys.argv
+    if not force_setup:
+        try:
+            import colorama  # noqa: F401
+
+            return
+        except ImportError:
+            pass
+    if not MODULE_VENV.exists():
+        print("🐍 Creating virtual environment...")
+        subprocess.run([sys.executable, "-m", "venv", str(MODULE_VENV)], check=True)
+    sentinel = MODULE_VENV / ".modules_ok"
+    if force_setup or not sentinel.exists():
+        pip = MODULE_VENV / "bin" / "pip"
+        subprocess.run([str(pip), "install", "--quiet", *REQUIRED_MODULES], check=True)
+        sentinel.touch()
+    python = MODULE_VENV / "bin" / "python"
+    os.execv(str(python), [str(python), *[a for a in sys.argv if a != "--setup"]])
+
+
+if __name__ == "__main__":
+    module_venv()
+
+from colorama import Fore, Style, init  # noqa: E402
+
+# Color prefixes resolved once at import; the print paths concatenate these
+# plain strings instead of doing attribute lookups per call.
+CYAN = Fore.CYAN
+GREEN = Fore.GREEN
+YELLOW = Fore.YELLOW
+RED = Fore.RED
+RESET = Style.RESET_ALL
+
+try:
+    import ahocorasick
+except ImportError:
+    # Optional speedup; the plain scan below still works without it.
+    ahocorasick = None
+
+# orjson and rapidfuzz are only needed for export and leftover fuzzy
+# matching respectively, so they are imported lazily at first use to keep
+# startup lean (see _get_orjson / _get_rapidfuzz).
+_orjson = False
+_rapidfuzz = False
+
+
+def _get_orjson():
+    """Import orjson on first use; None when unavailable."""
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson as _orjson
+        except ImportError:
+            _orjson = None
+    return _orjson
+
+
+def _get_rapidfuzz():
+    """Import rapidfuzz on first use; None when unavailable."""
+    global _rapidfuzz
+    if _rapidfuzz is False:
+        try:
+            from rapidfuzz import fuzz, process
+
+            _rapidfuzz = (fuzz, process)
+        except ImportError:
+            _rapidfuzz = None
+    return _rapidfuzz
+
+_colorama_ready = False
+
+
+def _init_colorama():
+    """Wrap stdout for color support on first use, not at import time."""
+    global _colorama_ready
+    if not _colorama_ready:
+        init(autoreset=True)
+        _colorama_ready = True
+
+
+# Fuses the lowercase + strip-separators chain into one C-level pass.
+_SEPARATORS = re.compile(r"[\s\-]+")
+
+
+@functools.lru_cache(maxsize=None)
+def _compact(name):
+    """Lowercase a name and strip spaces/dashes in a single regex pass.
+
+    Memoized: package names come back unchanged across rescans, so repeat
+    calls are dict hits instead of regex work.
+    """
+    return _SEPARATORS.sub("", name.lower())
+
+
+def _render_frame(lines):
+    """Emit a whole frame of output as one write instead of a print per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _read_key(block=True):
+    """Read a single keypress from stdin and name it (UP/DOWN/ENTER/ESC/char).
+
+    Uses cbreak mode via termios/tty, so no root access, no background hook
+    thread, and no idle CPU burn. With block=False, returns None immediately
+    when no key is queued.
+    """
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        # TCSANOW, not setcbreak's default TCSAFLUSH: flushing would discard
+        # keys already queued, which the menu's coalescing drain relies on.
+        tty.setcbreak(fd, termios.TCSANOW)
+        # Read the fd directly with os.read: sys.stdin is buffered, and bytes
+        # pulled into its buffer are invisible to select(), which would make
+        # an arrow's \x1b[A look like a bare Esc followed by stray keys.
+        if not block and not select.select([fd], [], [], 0)[0]:
+            return None
+        ch = os.read(fd, 1)
+        if ch == b"\x1b":
+            # A bare Esc has nothing queued behind it; arrows send \x1b[A etc.
+            if select.select([fd], [], [], 0.05)[0]:
+                seq = os.read(fd, 2)
+                if seq == b"[A":
+                    return "UP"
+                if seq == b"[B":
+                    return "DOWN"
+                return ""
+            return "ESC"
+        if ch in (b"\r", b"\n"):
+            return "ENTER"
+        return ch.decode(errors="replace").lower()
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+@dataclass(slots=True)
+class AppInfo:
+    """A single installed application."""
+
+    name: str
+    path: str
+    source: str
+    is_brew_cask: bool = False
+    # Normalized forms, computed once so the match loops never call
+    # lower()/replace() per comparison.
+    name_norm: str = ""
+    name_compact: str = ""
+
+    def __post_init__(self):
+        if not self.name_norm:
+            self.name_norm = self.name.lower().replace(" ", "-")
+        if not self.name_compact:
+            self.name_compact = _compact(self.name)
+
+
+class BrewUpChecker:
+    """Collects installed applications and compares them against Homebrew."""
+
+    def __init__(self, use_cache=True, cache_ttl=300.0):
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self.installed_apps: List[AppInfo] = []
+        self.brew_formulae: List[str] = []
+        self.brew_casks: List[str] = []
+        self.brew_equivalents: List[dict] = []
+        self._cask_index = frozenset()
+        self._formula_index = frozenset()
+        self._brew_apps: List[AppInfo] = []
+        self._manual_apps: List[AppInfo] = []
+        # Parallel name arrays for the bulk render paths, so listing hundreds
+        # of apps walks a flat list of strings instead of chasing attributes
+        # through AppInfo objects.
+        self._brew_names: List[str] = []
+        self._manual_names: List[str] = []
+
+    # =========================================================================
+    # DATA COLLECTION
+    # =========================================================================
+    def _build_package_indexes(self):
+        """Normalize every cask/formula name once into O(1) lookup sets."""
+        self._cask_index = frozenset(
+            {cask.lower() for cask in self.brew_casks}
+            | {cask.lower().replace("-", " ") for cask in self.brew_casks}
+            | {cask.lower().replace("-", "") for cask in self.brew_casks}
+        )
+        self._formula_index = frozenset(
+            formula.lower() for formula in self.brew_formulae
+        )
+        # (original, lowered) pairs so scan loops never re-lower per comparison.
+        self._casks_lower = [(cask, cask.lower()) for cask in self.brew_casks]
+        self._formulae_lower = [
+            (formula, formula.lower()) for formula in self.brew_formulae
+        ]
+        # Compiled alternations let the "package name inside app name" test
+        # run as a single C-level regex search instead of a Python loop.
+        self._cask_by_lower = {lower: cask for cask, lower in self._casks_lower}
+        self._formula_by_lower = {
+            lower: formula for formula, lower in self._formulae_lower
+        }
+        self._cask_regex = self._compile_alternation(self._cask_by_lower)
+        self._formula_regex = self._compile_alternation(self._formula_by_lower)
+        # compact (dash-stripped) forms mapped back to the originals, for the
+        # fuzzy matcher.
+        self._cask_compact = {_compact(cask): cask for cask in self.brew_casks}
+        self._formula_compact = {
+            _compact(formula): formula for formula in self.brew_formulae
+        }
+        # The package automaton (a trie with failure links underneath) is
+        # built once here and shared by every later equivalence lookup.
+        self._package_automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for cask in self.brew_casks:
+                automaton.add_word(cask.lower(), ("cask", cask))
+            for formula in self.brew_formulae:
+                if not automaton.exists(formula.lower()):
+                    automaton.add_word(formula.lower(), ("formula", formula))
+            # With zero words make_automaton() leaves the object in trie
+            # state and iter() raises; stay on the scan path instead.
+            if len(automaton):
+                automaton.make_automaton()
+                self._package_automaton = automaton
+
+    @staticmethod
+    def _compile_alternation(names):
+        if not names:
+            return None
+        ordered = sorted((re.escape(name) for name in names), key=len, reverse=True)
+        return re.compile("(" + "|".join(ordered) + ")")
+
+    BREW_CACHE = Path.home() / ".cache" / "brew-up" / "brew_lists.json"
+
+    def _brew_dir_mtimes(self):
+        """mtimes of the Cellar/Caskroom dirs — they change whenever brew (un)installs."""
+        prefix = os.environ.get(
+            "HOMEBREW_PREFIX",
+            "/opt/homebrew" if os.path.isdir("/opt/homebrew") else "/usr/local",
+        )
+        mtimes = {}
+        for key, subdir in (("cellar", "Cellar"), ("caskroom", "Caskroom")):
+            try:
+                mtimes[key] = os.stat(os.path.join(prefix, subdir)).st_mtime_ns
+            except OSError:
+                mtimes[key] = 0
+        return mtimes
+
+    def _load_cached_brew(self):
+        """Populate package lists from the on-disk cache; False on miss."""
+        if not self.use_cache:
+            return False
+        try:
+            if time.time() - os.stat(self.BREW_CACHE).st_mtime > self.cache_ttl:
+                return False
+            with open(self.BREW_CACHE) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if cached.get("mtimes") != self._brew_dir_mtimes():
+            return False
+        self.brew_formulae = [sys.intern(name) for name in cached["formulae"]]
+        self.brew_casks = [sys.intern(name) for name in cached["casks"]]
+        return True
+
+    def _save_brew_cache(self):
+        self.BREW_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a crashed run never leaves a torn cache.
+        tmp_path = self.BREW_CACHE.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "mtimes": self._brew_dir_mtimes(),
+                    "formulae": self.brew_formulae,
+                    "casks": self.brew_casks,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.BREW_CACHE)
+
+    def get_brew_packages(self):
+        """Ask brew for everything it currently manages."""
+        if self._load_cached_brew():
+            self._build_package_indexes()
+            return
+        print(f"{CYAN}🍺 Reading installed Homebrew packages...{RESET}")
+        # Each brew invocation pays Ruby startup cost, so run both at once
+        # and keep brew from kicking off an implicit update underneath us.
+        env = {
+            **os.environ,
+            "HOMEBREW_NO_AUTO_UPDATE": "1",
+            "HOMEBREW_NO_INSTALL_CLEANUP": "1",
+        }
+        formula_proc = subprocess.Popen(
+            ["brew", "list", "--formula"], stdout=subprocess.PIPE, env=env
+        )
+        cask_proc = subprocess.Popen(
+            ["brew", "list", "--cask"], stdout=subprocess.PIPE, env=env
+        )
+        formula_out, _ = formula_proc.communicate()
+        cask_out, _ = cask_proc.communicate()
+        # brew names are ASCII; decode the whole buffer once instead of
+        # paying for a TextIOWrapper on the pipe.
+        # Interned names compare by pointer on the equality fast path and are
+        # stored once even though they recur across the indexes.
+        if formula_proc.returncode == 0:
+            self.brew_formulae = [
+                sys.intern(name)
+                for name in formula_out.decode("ascii", "replace").split()
+            ]
+        if cask_proc.returncode == 0:
+            self.brew_casks = [
+                sys.intern(name)
+                for name in cask_out.decode("ascii", "replace").split()
+            ]
+        self._save_brew_cache()
+        self._build_package_indexes()
+
+    def _scan_macos_dir(self, app_dir):
+        """Collect AppInfo entries for one macOS application folder."""
+        apps = []
+        try:
+            it = os.scandir(app_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            return apps
+        with it:
+            for entry in it:
+                # Cheapest test first; is_dir also rejects dangling symlinks.
+                name = entry.name
+                if name[-4:] != ".app":
+                    continue
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                display_name = name[:-4]
+                app_name = display_name.lower()
+                is_brew_cask = (
+                    app_name in self._cask_index
+                    or app_name.replace(" ", "") in self._cask_index
+                    or app_name.replace("-", "") in self._cask_index
+                )
+                apps.append(
+                    AppInfo(
+                        name=display_name,
+                        path=entry.path,
+                        source="brew cask" if is_brew_cask else "manual",
+                        is_brew_cask=is_brew_cask,
+                    )
+                )
+        return apps
+
+    def _scan_linux_dir(self, app_dir):
+        """Collect AppInfo entries for one Linux .desktop directory."""
+        apps = []
+        try:
+            it = os.scandir(app_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            return apps
+        with it:
+            for entry in it:
+                name = entry.name
+                if name[-8:] != ".desktop":
+                    continue
+                display_name = name[:-8]
+                is_brew = display_name.lower() in self._formula_index
+                apps.append(
+                    AppInfo(
+                        name=display_name,
+                        path=entry.path,
+                        source="linuxbrew" if is_brew else "manual",
+                        is_brew_cask=is_brew,
+                    )
+                )
+        return apps
+
+    def _collect_app_dirs(self, scan_one, app_dirs):
+        """Scan the directories concurrently — the work is syscall-bound, so
+        threads overlap the disk waits — then flatten in a stable order."""
+        with ThreadPoolExecutor(max_workers=len(app_dirs)) as pool:
+            for apps in pool.map(scan_one, app_dirs):
+                for app in apps:
+                    self.installed_apps.append(app)
+                    # Partition while flattening — no second pass later.
+                    if app.is_brew_cask:
+                        self._brew_apps.append(app)
+                        self._brew_names.append(app.name)
+                    else:
+                        self._manual_apps.append(app)
+                        self._manual_names.append(app.name)
+
+    def get_applications_macos(self):
+        """Scan the standard macOS application folders for .app bundles."""
+        self._collect_app_dirs(
+            self._scan_macos_dir,
+            [
+                "/Applications",
+                "/System/Applications",
+                os.path.expanduser("~/Applications"),
+            ],
+        )
+
+    def get_applications_linux(self):
+        """Scan the standard Linux .desktop directories."""
+        self._collect_app_dirs(
+            self._scan_linux_dir,
+            [
+                "/usr/share/applications",
+                os.path.expanduser("~/.local/share/applications"),
+            ],
+        )
+
+    def get_applications(self):
+        """Enumerate installed applications for the current platform."""
+        print(f"{CYAN}🔍 Scanning installed applications...{RESET}")
+        if platform.system() == "Darwin":
+            self.get_applications_macos()
+        else:
+            self.get_applications_linux()
+
+    def check_brew_equivalents(self):
+        """Suggest brew casks/formulae for apps that brew does not manage yet."""
+        self.brew_equivalents = []
+        # The manual partition was already built during enumeration, so there
+        # is no need to rescan installed_apps here.
+        if not self._manual_apps:
+            return
+        # Exact normalized hits are hash lookups; only the misses go through
+        # the substring/fuzzy machinery.
+        candidates = []
+        for app in self._manual_apps:
+            if app.name_norm in self._cask_by_lower:
+                self.brew_equivalents.append(
+                    {
+                        "app": app.name,
+                        "type": "cask",
+                        "match": self._cask_by_lower[app.name_norm],
+                    }
+                )
+            elif app.name_norm in self._formula_by_lower:
+                self.brew_equivalents.append(
+                    {
+                        "app": app.name,
+                        "type": "formula",
+                        "match": self._formula_by_lower[app.name_norm],
+                    }
+                )
+            else:
+                candidates.append(app)
+        if not candidates:
+            return
+        if self._package_automaton is not None:
+            self._check_equivalents_automaton(candidates)
+        else:
+            self._check_equivalents_scan(candidates)
+        self._check_equivalents_fuzzy(candidates)
+
+    def _check_equivalents_fuzzy(self, candidates):
+        """Fuzzy-match the leftovers with RapidFuzz (C-level ratio scoring)."""
+        rapidfuzz = _get_rapidfuzz()
+        if rapidfuzz is None:
+            return
+        rf_fuzz, rf_process = rapidfuzz
+        matched = {suggestion["app"] for suggestion in self.brew_equivalents}
+        lookups = (
+            ("cask", self._cask_compact, list(self._cask_compact)),
+            ("formula", self._formula_compact, list(self._formula_compact)),
+        )
+        for app in candidates:
+            if app.name in matched:
+                continue
+            for kind, compact_map, keys in lookups:
+                if not keys:
+                    continue
+                hit = rf_process.extractOne(
+                    app.name_compact, keys, scorer=rf_fuzz.ratio, score_cutoff=70
+                )
+                if hit:
+                    self.brew_equivalents.append(
+                        {"app": app.name, "type": kind, "match": compact_map[hit[0]]}
+                    )
+                    break
+
+    def _check_equivalents_automaton(self, candidates):
+        """Match apps against packages in one pass per direction (Aho-Corasick)."""
+        package_automaton = self._package_automaton
+
+        app_automaton = ahocorasick.Automaton()
+        for index, app in enumerate(candidates):
+            if app_automaton.exists(app.name_norm):
+                app_automaton.get(app.name_norm).append(index)
+            else:
+                app_automaton.add_word(app.name_norm, [index])
+        app_automaton.make_automaton()
+
+        # Best match per candidate; casks win over formulae like the old scan.
+        matches = {}
+
+        def record(index, kind, name):
+            best = matches.get(index)
+            if best is None or (best[0] == "formula" and kind == "cask"):
+                matches[index] = (kind, name)
+
+        # Direction 1: package name occurs inside the app name.
+        for index, app in enumerate(candidates):
+            for _, (kind, name) in package_automaton.iter(app.name_norm):
+                record(index, kind, name)
+
+        # Direction 2: app name occurs inside the package name.
+        for kind, names in (("cask", self.brew_casks), ("formula", self.brew_formulae)):
+            for name in names:
+                for _, indexes in app_automaton.iter(name.lower()):
+                    for index in indexes:
+                        record(index, kind, name)
+
+        for index, app in enumerate(candidates):
+            if index in matches:
+                kind, name = matches[index]
+                self.brew_equivalents.append(
+                    {"app": app.name, "type": kind, "match": name}
+                )
+
+    def _check_equivalents_scan(self, candidates):
+        """Plain nested-loop fallback when pyahocorasick is unavailable."""
+        for app in candidates:
+            app_name = app.name_norm
+            matched = False
+            for kind, regex, by_lower, pairs in (
+                ("cask", self._cask_regex, self._cask_by_lower, self._casks_lower),
+                (
+                    "formula",
+                    self._formula_regex,
+                    self._formula_by_lower,
+                    self._formulae_lower,
+                ),
+            ):
+                # Longest-match-first regex covers "package inside app name".
+                match = regex.search(app_name) if regex else None
+                if match:
+                    self.brew_equivalents.append(
+                        {"app": app.name, "type": kind, "match": by_lower[match.group(1)]}
+                    )
+                    matched = True
+                    break
+                # Remaining direction: app name inside a package name.
+                for original, lowered in pairs:
+                    if app_name in lowered:
+                        self.brew_equivalents.append(
+                            {"app": app.name, "type": kind, "match": original}
+                        )
+                        matched = True
+                        break
+                if matched:
+                    break
+
+    # =========================================================================
+    # FILTERS
+    # =========================================================================
+    def get_brew_managed_apps(self):
+        return self._brew_apps
+
+    def get_manual_apps(self):
+        return self._manual_apps
+
+    # =========================================================================
+    # REPORTING
+    # =========================================================================
+    def show_summary(self):
+        _render_frame(
+            [
+                f"{CYAN}📊 Summary{RESET}",
+                "=" * 40,
+                f"📦 Total applications: {len(self.installed_apps)}",
+                f"🍺 Managed by Homebrew: {len(self.get_brew_managed_apps())}",
+                f"📱 Manually installed: {len(self.get_manual_apps())}",
+                f"💡 Brew equivalents available: {len(self.brew_equivalents)}",
+            ]
+        )
+
+    def show_brew_managed(self):
+        lines = [f"{GREEN}🍺 Managed by Homebrew:{RESET}"]
+        lines.extend(f"  ✅ {name}" for name in self._brew_names)
+        _render_frame(lines)
+
+    def show_manual(self):
+        lines = [f"{YELLOW}📱 Manually installed:{RESET}"]
+        lines.extend(f"  📦 {name}" for name in self._manual_names)
+        _render_frame(lines)
+
+    def show_equivalents(self):
+        lines = [f"{CYAN}💡 Suggested brew equivalents:{RESET}"]
+        if not self.brew_equivalents:
+            lines.append(
+                "  🎉 Nothing to suggest — everything is either managed or unknown."
+            )
+        for suggestion in self.brew_equivalents:
+            flag = "--cask " if suggestion["type"] == "cask" else ""
+            lines.append(
+                f"  💡 {suggestion['app']}: brew install {flag}{suggestion['match']}"
+            )
+        _render_frame(lines)
+
+    def export_to_json(self, filename="brew_up_report.json"):
+        """Write the scan results to a JSON report next to the script."""
+        data = {
+            "generated": datetime.now().isoformat(),
+            "total_apps": len(self.installed_apps),
+            "brew_managed": len(self.get_brew_managed_apps()),
+            "manual": len(self.get_manual_apps()),
+            "apps": self.installed_apps,
+            "brew_equivalents": self.brew_equivalents,
+        }
+        orjson = _get_orjson()
+        if orjson is not None:
+            # orjson serializes the AppInfo dataclasses directly in C.
+            with open(filename, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS,
+                    )
+                )
+        else:
+            data["apps"] = [asdict(app) for app in self.installed_apps]
+            with open(filename, "w") as f:
+                json.dump(data, f, indent=2)
+        print(f"{GREEN}💾 Report written to {filename}{RESET}")
+
+    # =========================================================================
+    # INTERACTIVE MENU
+    # =========================================================================
+    def run_option(self, selected):
+        if selected == 0:
+            self.show_summary()
+        elif selected == 1:
+            self.show_brew_managed()
+        elif selected == 2:
+            self.show_manual()
+        elif selected == 3:
+            self.show_equivalents()
+        elif selected == 4:
+            self.export_to_json()
+
+    # Rows of header text printed above the menu options.
+    MENU_HEADER_ROWS = 3
+
+    MENU_OPTIONS = (
+        "📊 Show summary",
+        "🍺 List brew-managed applications",
+        "📱 List manually installed applications",
+        "💡 Show suggested brew equivalents",
+        "💾 Export report to JSON",
+        "🚪 Quit",
+    )
+
+    UP_KEYS = frozenset({"UP", "k"})
+    DOWN_KEYS = frozenset({"DOWN", "j"})
+    SELECT_KEYS = frozenset({"ENTER", " "})
+    QUIT_KEYS = frozenset({"q", "ESC"})
+
+    def _menu_row_str(self, index, selected):
+        """One option row, prefixed with its absolute cursor position."""
+        row = self.MENU_HEADER_ROWS + index + 1
+        labels = self._menu_selected if index == selected else self._menu_plain
+        return f"\x1b[{row};1H\x1b[2K{labels[index]}"
+
+    def _draw_menu_row(self, index, selected):
+        sys.stdout.write(self._menu_row_str(index, selected))
+
+    def _draw_menu_full(self, selected):
+        frame = [
+            "\x1b[2J\x1b[H",
+            f"{CYAN}🍺 Brew-Up Application Checker{RESET}\n",
+            "Use ↑/↓ and Enter to choose (q to quit):\n",
+        ]
+        frame.extend(
+            self._menu_row_str(i, selected) for i in range(len(self.MENU_OPTIONS))
+        )
+        # One write per frame keeps the tty from repainting mid-frame.
+        sys.stdout.write("".join(frame))
+        sys.stdout.flush()
+
+    def display_menu(self):
+        # Both render variants of every row are formatted once up front, so
+        # redraws only index into these lists.
+        self._menu_plain = [f"  {option}" for option in self.MENU_OPTIONS]
+        self._menu_selected = [
+            f"{GREEN}➤ {option}{RESET}" for option in self.MENU_OPTIONS
+        ]
+        last_option = len(self.MENU_OPTIONS) - 1
+        selected = 0
+        pending = None
+        self._draw_menu_full(selected)
+        while True:
+            key = pending if pending is not None else _read_key()
+            pending = None
+            previous = selected
+            if key in self.UP_KEYS or key in self.DOWN_KEYS:
+                step = -1 if key in self.UP_KEYS else 1
+                selected = (selected + step) % len(self.MENU_OPTIONS)
+                # Drain whatever is already queued (held-down arrow keys
+                # arrive faster than we repaint) so one redraw covers all.
+                while True:
+                    queued = _read_key(block=False)
+                    if queued is None:
+                        break
+                    if queued in self.UP_KEYS:
+                        selected = (selected - 1) % len(self.MENU_OPTIONS)
+                    elif queued in self.DOWN_KEYS:
+                        selected = (selected + 1) % len(self.MENU_OPTIONS)
+                    else:
+                        pending = queued
+                        break
+            elif key in self.SELECT_KEYS:
+                if selected == last_option:
+                    break
+                sys.stdout.write("\x1b[2J\x1b[H")
+                sys.stdout.flush()
+                self.run_option(selected)
+                input("\nPress Enter to return to the menu...")
+                self._draw_menu_full(selected)
+                continue
+            elif key in self.QUIT_KEYS:
+                break
+            if selected != previous:
+                # Only the two affected rows change; repaint just those.
+                self._draw_menu_row(previous, selected)
+                self._draw_menu_row(selected, selected)
+                sys.stdout.flush()
+
+
+def main():
+    if platform.system() not in ("Darwin", "Linux"):
+        print(f"{RED}❌ Unsupported platform: {platform.system()}{RESET}")
+        sys.exit(1)
+    _init_colorama()
+    cache_ttl = 300.0
+    if "--cache-ttl" in sys.argv:
+        try:
+            cache_ttl = float(sys.argv[sys.argv.index("--cache-ttl") + 1])
+        except (IndexError, ValueError):
+            print(f"{RED}❌ --cache-ttl needs a number of seconds{RESET}")
+            sys.exit(1)
+    checker = BrewUpChecker(
+        use_cache="--no-cache" not in sys.argv, cache_ttl=cache_ttl
+    )
+    checker.get_brew_packages()
+    checker.get_applications()
+    checker.check_brew_equivalents()
+    checker.display_menu()
+
+
+if __name__ == "__main__":
+    main()